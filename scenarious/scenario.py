@@ -1,18 +1,37 @@
-import yaml
 import six
+from six.moves import intern
 from functools import partial
-from collections import OrderedDict
+from contextlib import contextmanager
 from .reference_handler import ReferenceHandler
 from .store_handler import EntityStore
 from .type_handlers.base import TypeHandlerException
 
 
+# Marks a type definition that was not passed, None is kept for keys present in the scenario without a value
+_UNDEFINED = object()
+
+
+def _intern(name):
+    # Python 2 can only intern byte strings, unicode type names are left as they are
+    return intern(name) if type(name) is str else name
+
+
+def _load_yaml(stream):
+    # yaml is only needed for file sources, import it on demand to keep importing scenarious cheap
+    import yaml
+
+    # Prefer the libyaml based loader when pyyaml was built with it
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
 class ScenariousException(Exception):
     pass
 
 
 class Scenario(object):
 
+    __slots__ = ('_raw_data', '_type_handlers', '_ref_handler', '_entity_store', '_type_name_cache', '_add_methods')
+
     @classmethod
     def load(cls, source, type_handlers, load_priority=None, reference_handler=None, entity_store=None):
         """
@@ -27,13 +46,18 @@ class Scenario(object):
         if isinstance(source, dict):
             raw = source
 
+        elif isinstance(source, six.string_types):
+            # Hand the file object to the loader so it reads incrementally, binary mode lets yaml do the decoding
+            with open(source, 'rb') as fh:
+                raw = _load_yaml(fh)
+
         else:
-            raw = yaml.load(open(source) if isinstance(source, six.string_types) else source)
+            raw = _load_yaml(source)
 
         type_handlers_by_name = {}
         for th in type_handlers:
             names = th.__type_name__ if type(th.__type_name__) in [list, tuple] else [th.__type_name__, th.__type_name__ + 's']
-            type_handlers_by_name.update({name: th for name in names})
+            type_handlers_by_name.update({_intern(name): th for name in names})
 
         reference_handler = reference_handler or ReferenceHandler()
         entity_store = entity_store or EntityStore()
@@ -46,15 +70,15 @@ class Scenario(object):
         self._type_handlers = handlers_by_type_name
         self._ref_handler = reference_handler
         self._entity_store = entity_store
+        self._type_name_cache = {}
+        self._add_methods = {}
 
         load_priority = load_priority or []
+        prioritized = set(load_priority)
+        load_order = list(load_priority) + [_type for _type in self._raw_data if _type not in prioritized]
 
-        for _type in load_priority:
-            self._load_type_definition(self._get_type_name(_type))
-
-        for _type, type_def in iter(self._raw_data.items()):
-            if _type not in load_priority:
-                self._load_type_definition(self._get_type_name(_type), type_def)
+        for _type in load_order:
+            self._load_type_definition(self._get_type_name(_type), self._raw_data.get(_type, _UNDEFINED))
 
     def __getattr__(self, key):
         """
@@ -70,10 +94,16 @@ class Scenario(object):
         :param key:
         :return: object
         """
+        add_method = self._add_methods.get(key)
+        if add_method is not None:
+            return add_method
+
         if key.startswith('add_'):
-            type_name = key.replace('add_', '')
+            type_name = key[len('add_'):]
             if self._entity_store.has_type(self._get_type_name(type_name)):
-                return partial(self._create_obj, type_name)
+                # Types are never removed from the store, so the bound method can be reused on every later access
+                add_method = self._add_methods[key] = partial(self._create_obj, type_name)
+                return add_method
 
             else:
                 raise ScenariousException("Invalid type name '{}'".format(type_name))
@@ -88,7 +118,13 @@ class Scenario(object):
                 raise AttributeError("%s doesn't have type '%s'" % (self.__class__.__name__, type_name))
 
     def _get_type_name(self, name):
-        return name.rstrip('s')
+        type_name = self._type_name_cache.get(name)
+        if type_name is None:
+            # Interned so the many dict lookups keyed by type name can match by identity
+            type_name = _intern(name.rstrip('s') if name.endswith('s') else name)
+            self._type_name_cache[name] = type_name
+
+        return type_name
 
     def _get_type_handler(self, name):
         # We try name and name without last letter, in case plural is used
@@ -102,7 +138,8 @@ class Scenario(object):
         handler = self._get_type_handler(type_name)
 
         obj_id, obj_def = self._entity_store.parse_obj_def(data)
-        new_obj_def = self._process_references_and_methods(type_name, obj_def, special_methods or [])
+        new_obj_def = self._process_references_and_methods(
+            type_name, obj_def, special_methods if special_methods is not None else [])
         new_obj = handler.create(**new_obj_def)
 
         self._entity_store.add(new_obj, type_name=type_name, entity_id=obj_id)
@@ -136,27 +173,75 @@ class Scenario(object):
 
         return value
 
-    def _load_type_definition(self, type_name, type_def=None):
-        type_def = type_def or self._raw_data.get(type_name, self._raw_data[type_name+"s"])
+    def _load_type_definition(self, type_name, type_def=_UNDEFINED):
+        if self._entity_store.has_type(type_name):
+            return
 
-        if not self._entity_store.has_type(type_name):
-            if type(type_def) is list:
-                for data in type_def:
-                    self._load_type(type_name, data)
+        if type_def is _UNDEFINED:
+            # Definitions can be keyed by the singular or the plural type name
+            if type_name in self._raw_data:
+                type_def = self._raw_data[type_name]
 
-            elif type(type_def) is dict:
-                self._load_type(type_name, type_def)
+            elif type_name + 's' in self._raw_data:
+                type_def = self._raw_data[type_name + 's']
 
-            elif type(type_def) is int:
-                for _ in range(type_def):
-                    self._load_type(type_name, {})
             else:
-                raise ScenariousException(
-                    "Type definition '{}' must be a list, dict or int. Got '{}' instead".format(type_name,
-                                                                                                type(type_def)))
+                raise ScenariousException("No definition found for type '{}'".format(type_name))
 
-    def _load_type(self, type_name, type_def):
+        load = self._LOAD_DISPATCH.get(type(type_def))
+        if load is None:
+            raise ScenariousException(
+                "Type definition '{}' must be a list, dict or int. Got '{}' instead".format(type_name, type(type_def)))
+
+        load(self, type_name, type_def)
+
+    def _load_many(self, type_name, type_def):
+        for data in type_def:
+            self._load_type(type_name, data)
+
+    def _load_one(self, type_name, type_def):
+        self._load_type(type_name, type_def)
+
+    def _load_n(self, type_name, type_def):
+        """
+        Objects built only from defaults have no references nor special methods to process,
+        so they are created straight from the handler without going through _load_type or _create_obj.
+        Subclasses that need to see these objects should override this method.
+        """
+        handler = self._get_type_handler(type_name)
+        add = self._entity_store.add
+
+        with self._load_errors(type_name):
+            for _ in range(type_def):
+                add(handler.create(), type_name=type_name)
+
+    # Loader for each kind of type definition, keyed by the exact type so bool isn't taken as int
+    _LOAD_DISPATCH = {
+        list: _load_many,
+        dict: _load_one,
+        int: _load_n,
+    }
+
+    @contextmanager
+    def _load_errors(self, type_name):
+        """
+        Reports any error raised while loading objects of type_name as a ScenariousException,
+        handler and scenario errors are raised as they are
+        """
         try:
+            yield
+
+        except TypeHandlerException as te:
+            raise te
+
+        except ScenariousException as se:
+            raise se
+
+        except Exception as e:
+            raise ScenariousException("Error loading type '{}'. Detail: {}".format(type_name, e))
+
+    def _load_type(self, type_name, type_def):
+        with self._load_errors(type_name):
             special_methods = []
             new_obj = self._create_obj(type_name, type_def, special_methods=special_methods)
 
@@ -175,37 +260,65 @@ class Scenario(object):
 
                 method(*params)
 
-        except TypeHandlerException as te:
-            raise te
+    def _process_references_and_methods(self, type_name, obj_def, special_methods):
+        if type(obj_def) is not dict:
+            is_ref = isinstance(obj_def, six.string_types) and self._ref_handler.is_reference(obj_def)
+            return self._resolve_reference(obj_def) if is_ref else obj_def
 
-        except ScenariousException as se:
-            raise se
+        return self._walk_def(type_name, obj_def, special_methods)
 
-        except Exception as e:
-            raise ScenariousException("Error loading type '{}'. Detail: {}".format(type_name, e))
+    def _walk_def(self, type_name, root, special_methods):
+        """
+        Iterates over a type definition converting references and tracking special methods.
 
-    def _process_references_and_methods(self, type_name, obj_def, special_methods):
-        if type(obj_def) is not dict:
-            resolved_def = self._resolve_reference(obj_def) if self._ref_handler.is_reference(obj_def) else obj_def
+        The definition is walked depth first with an explicit stack of (items iterator, target container) so
+        nesting doesn't add python frames. A child iterator is pushed as soon as it is found and its parent resumes
+        after it, so special methods and references are handled in the same order as the definition.
+        Special method keys are routed to special_methods and left out of the resolved definition.
 
-        else:
-            # Recursively iterate over a type_def converting references and tracking special methods
-            resolved_def = dict(obj_def)
+        :param type_name: type the definition belongs to
+        :param root: the type definition
+        :param special_methods: list where (method, param) pairs are collected
+        :return: the resolved definition
+        """
+        # Bind the handler and lookups once, they are invariant for every key of the definition
+        handler = self._get_type_handler(type_name)
+        is_method = handler.is_method
+        get_special_method = handler.get_special_method
+        is_reference = self._ref_handler.is_reference
+        resolve_reference = self._resolve_reference
+        string_types = six.string_types
+        add_special_method = special_methods.append
+
+        resolved_def = {}
+        stack = [(iter(root.items()), resolved_def, False)]
+        push = stack.append
+
+        while stack:
+            items, target, in_list = stack[-1]
 
-            for k, v in obj_def.items():
-                handler = self._get_type_handler(type_name)
+            for k, v in items:
+                if not in_list and is_method(k):
+                    add_special_method((get_special_method(k), v))
 
-                if handler.is_method(k):
-                    special_methods.append((handler.get_special_method(k), v))
+                elif type(v) is dict:
+                    child = target[k] = {}
+                    push((iter(v.items()), child, False))
+                    break
 
-                elif isinstance(v, (dict, OrderedDict)):
-                    resolved_def[k] = self._process_references_and_methods(type_name, v, special_methods)
+                elif not in_list and isinstance(v, (list, tuple)):
+                    child = target[k] = [None] * len(v)
+                    push((enumerate(v), child, True))
+                    break
 
-                elif isinstance(v, (list, tuple)):
-                    resolved_def[k] = [self._process_references_and_methods(type_name, e, special_methods) for e in v]
+                elif isinstance(v, string_types) and is_reference(v):
+                    target[k] = resolve_reference(v)
 
-                elif self._ref_handler.is_reference(v):
-                    resolved_def[k] = self._resolve_reference(v)
+                else:
+                    target[k] = v
+
+            else:
+                stack.pop()
 
         return resolved_def
 
@@ -21,7 +21,7 @@ class EntityStore(object):
     def __init__(self):
         self._objects = defaultdict(dict)
         self._aliased_objects = defaultdict(dict)
-        self._objects_id_counter = defaultdict(lambda: 1)  # start off counter from 1
+        self._objects_id_counter = {}
 
     @classmethod
     def parse_obj_def(cls, obj_def):
@@ -36,23 +36,29 @@ class EntityStore(object):
         :param type_name: object type
         :return:
         """
-        previous_e = self._objects[type_name].pop(obj_id.identifier)
-        new_id = self._objects_id_counter[type_name] + 1
-        self._objects[type_name][new_id] = previous_e
+        # Generate the new id while obj_id is still taken, otherwise the same id could be handed back
+        new_id = self._generate_id(type_name)
+        self._objects[type_name][new_id] = self._objects[type_name].pop(obj_id.identifier)
 
     def _generate_id(self, type_name):
         """
         Generates an automatic id for a given type. It implements an incremental
         counter per type making sure that the generated id doesnt collied with an existing one
-        that might have been assigned manually to a specific obj
+        that might have been assigned manually to a specific obj. The counter only moves forward,
+        so ids below it are never probed again
 
         :param type_name: type name to generate id for
         :return:
         """
-        while self._objects_id_counter[type_name] in self._objects[type_name]:
-            self._objects_id_counter[type_name] += 1
+        used_ids = self._objects[type_name]
+        counter = self._objects_id_counter.get(type_name, 1)  # start off counter from 1
 
-        return self._objects_id_counter[type_name]
+        while counter in used_ids:
+            counter += 1
+
+        self._objects_id_counter[type_name] = counter
+
+        return counter
 
     def has_type(self, type_name):
         return type_name in self._objects
@@ -83,7 +89,7 @@ class EntityStore(object):
 
         try:
             if not e and type(ref) in [int, float]:
-                e = self._objects.get(type_name, {}).get(six.string_types(ref), None)
+                e = self._objects.get(type_name, {}).get(str(ref), None)
 
             if not e and isinstance(ref, six.string_types):
                 e = self._objects.get(type_name, {}).get(int(ref), None)
@@ -1,4 +1,6 @@
+import os
 import unittest
+import tempfile
 from uuid import uuid4
 from random import randint
 
@@ -52,6 +54,23 @@ class GenreTypeHandler(BaseTestTypeHandler):
     name = lambda: faker.random_sample(['drama', 'comedy', 'action'], length=1)[0]
 
 
+class DirectorTypeHandler(BaseTestTypeHandler):
+    __type_name__ = 'director'
+    __requires__ = ['name']
+
+    @classmethod
+    def add_award(cls, director, award):
+        director.setdefault('awards', []).append(award)
+
+
+class FailingTypeHandler(BaseTestTypeHandler):
+    __type_name__ = 'failing'
+
+    @classmethod
+    def _do_create(cls, data):
+        raise ScenariousException("can't create")
+
+
 class ScenariousTest(unittest.TestCase):
 
     def test_load_type(self):
@@ -76,6 +95,23 @@ class ScenariousTest(unittest.TestCase):
         assert 'test movie' == s.movies[0].title
         assert 'drama' == s.movies[0].genre
 
+    def test_load_from_file_path(self):
+        fd, path = tempfile.mkstemp(suffix='.yml')
+        with os.fdopen(fd, 'w') as f:
+            f.write("""
+        actors:
+          - name: test
+            age: 20
+        """)
+
+        try:
+            s = Scenario.load(path, type_handlers=[ActorTypeHandler])
+        finally:
+            os.remove(path)
+
+        assert 1 == len(s.actors)
+        assert 'test' == s.actors[0].name
+
     def test_custom_ids(self):
         s = Scenario.load(StringIO("""
         actors:
@@ -150,6 +186,50 @@ class ScenariousTest(unittest.TestCase):
         # should've been forced to relocate because of test33 having _id:1
         assert 'test1' == s.by_id('actors', 3).name
 
+    def test_relocate_does_not_overwrite_custom_ids(self):
+        s = Scenario.load(StringIO("""
+        actors:
+          - name: test1
+            age: 20
+
+          - name: test2
+            age: 22
+
+          - id: 3
+            name: test3
+            age: 33
+
+          - id: 1
+            name: test4
+            age: 44
+        """), type_handlers=[ActorTypeHandler, MovieTypeHandler])
+
+        assert 4 == len(s.actors)
+
+        assert 'test4' == s.by_id('actors', 1).name
+        assert 'test2' == s.by_id('actors', 2).name
+        assert 'test3' == s.by_id('actors', 3).name
+        # relocated past the custom id 3 instead of overwriting it
+        assert 'test1' == s.by_id('actors', 4).name
+
+    def test_relocate_duplicated_custom_id(self):
+        s = Scenario.load(StringIO("""
+        actors:
+          - id: 1
+            name: test1
+            age: 20
+
+          - id: 1
+            name: test2
+            age: 22
+        """), type_handlers=[ActorTypeHandler])
+
+        assert 2 == len(s.actors)
+
+        assert 'test2' == s.by_id('actors', 1).name
+        # relocated to a new id instead of being overwritten on its old one
+        assert 'test1' == s.by_id('actors', 2).name
+
     def test_get_object_by_id(self):
         s = Scenario.load(StringIO("""
         actors:
@@ -175,6 +255,16 @@ class ScenariousTest(unittest.TestCase):
         assert "test movie 1" == s.by_id('movies', 1).title
         assert not s.by_id('movies', 99)
 
+    def test_get_object_by_numeric_ref_with_string_id(self):
+        s = Scenario.load(StringIO("""
+        actors:
+          - id: '7'
+            name: test
+            age: 20
+        """), type_handlers=[ActorTypeHandler])
+
+        assert 'test' == s.by_id('actors', 7).name
+
     def test_reference_objects(self):
         s = Scenario.load(StringIO("""
         actors:
@@ -231,6 +321,79 @@ class ScenariousTest(unittest.TestCase):
         assert 'test' == s.by_id('movies', 1).actor.name
         assert 'test2' == s.by_id('movies', 2).actor.name
 
+    def test_special_methods(self):
+        s = Scenario.load(StringIO("""
+        directors:
+          - name: test
+            _add_award: best picture
+        """), type_handlers=[DirectorTypeHandler])
+
+        assert ['best picture'] == s.directors[0].awards
+        # special method keys are not passed on as attributes
+        assert '_add_award' not in s.directors[0]
+
+    def test_load_priority(self):
+        created = []
+
+        class RecordingActorTypeHandler(ActorTypeHandler):
+            @classmethod
+            def _do_create(cls, data):
+                created.append('actor')
+                return super(RecordingActorTypeHandler, cls)._do_create(data)
+
+        class RecordingMovieTypeHandler(MovieTypeHandler):
+            @classmethod
+            def _do_create(cls, data):
+                created.append('movie')
+                return super(RecordingMovieTypeHandler, cls)._do_create(data)
+
+        s = Scenario.load(StringIO("""
+        movies:
+          - title: test movie
+            genre: drama
+            year: 2018
+
+        actors:
+          - name: test
+            age: 20
+        """), type_handlers=[RecordingActorTypeHandler, RecordingMovieTypeHandler], load_priority=['actors'])
+
+        assert 1 == len(s.actors)
+        assert 1 == len(s.movies)
+        assert ['actor', 'movie'] == created
+
+    def test_reference_type_defined_by_singular_name(self):
+        s = Scenario.load(StringIO("""
+        movies:
+          - title: test movie
+            genre: drama
+            actor: $actor_1
+            year: 2018
+
+        actor:
+          name: test
+          age: 20
+        """), type_handlers=[ActorTypeHandler, MovieTypeHandler])
+
+        assert 1 == len(s.actors)
+        assert 'test' == s.by_id('movies', 1).actor.name
+
+    def test_load_empty_type_definition(self):
+        config = StringIO("""
+        actors:
+        """)
+
+        with self.assertRaises(ScenariousException) as cm:
+            Scenario.load(config, [ActorTypeHandler])
+
+        assert 'must be a list, dict or int' in str(cm.exception)
+
+    def test_load_defaults_keeps_scenarious_errors(self):
+        with self.assertRaises(ScenariousException) as cm:
+            Scenario.load({'failings': 1}, [FailingTypeHandler])
+
+        assert "can't create" == str(cm.exception)
+
     def test_load_defaults(self):
         config = StringIO("""
         genres: 2